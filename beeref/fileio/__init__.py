@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with BeeRef.  If not, see <https://www.gnu.org/licenses/>.
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 from PyQt6 import QtCore
@@ -35,6 +36,10 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# Each thread holds a full resolution image while decoding, so keep
+# this small to bound peak memory use:
+LOAD_WORKERS = 4
+
 
 def load_bee(filename, scene, worker=None):
     """Load BeeRef native file."""
@@ -53,28 +58,36 @@ def save_bee(filename, scene, create_new=False, worker=None):
 
 
 def load_images(filenames, pos, scene, worker):
-    """Add images to existing scene."""
+    """Add images to existing scene.
+
+    The images are loaded in parallel, but added to the scene in the
+    order of the given filenames.
+    """
 
     errors = []
     items = []
     worker.begin_processing.emit(len(filenames))
-    for i, filename in enumerate(filenames):
-        logger.info(f'Loading image from file {filename}')
-        img, filename = load_image(filename)
-        worker.progress.emit(i)
-        if img.isNull():
-            logger.info(f'Could not load file {filename}')
-            errors.append(filename)
-            continue
-
-        item = BeePixmapItem(img, filename)
-        item.set_pos_center(pos)
-        scene.add_item_later({'item': item, 'type': 'pixmap'}, selected=True)
-        items.append(item)
-        if worker.canceled:
-            break
-        # Give main thread time to process items:
-        worker.msleep(10)
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        logger.info(f'Loading images from {len(filenames)} files')
+        results = executor.map(load_image, filenames)
+        for i, (img, filename) in enumerate(results):
+            worker.progress.emit(i)
+            if img.isNull():
+                logger.info(f'Could not load file {filename}')
+                errors.append(filename)
+                continue
+
+            logger.info(f'Loaded image from file {filename}')
+            item = BeePixmapItem(img, filename)
+            item.set_pos_center(pos)
+            scene.add_item_later({'item': item, 'type': 'pixmap'},
+                                 selected=True)
+            items.append(item)
+            if worker.canceled:
+                executor.shutdown(cancel_futures=True)
+                break
+            # Give main thread time to process items:
+            worker.msleep(10)
 
     scene.undo_stack.push(
         commands.InsertItems(scene, items, ignore_first_redo=True))
@@ -15,79 +15,64 @@
 
 import logging
 import os.path
+import shutil
 import tempfile
 from urllib.error import URLError
 from urllib import parse, request
 
-from PyQt6 import QtGui
+from PyQt6 import QtCore, QtGui
 
-import exif
 from lxml import etree
-import plum
 
 
 logger = logging.getLogger(__name__)
 
 
-def exif_rotated_image(path=None):
+# Downloaded images are streamed to disk in chunks of this size:
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def exif_rotated_image(path=None, max_size=None):
     """Returns a QImage that is transformed according to the source's
     orientation EXIF data.
+
+    Qt's image plugins read the orientation and apply it in the same
+    pass as decoding.
+
+    If ``max_size`` is given, images exceeding it in width or height
+    are scaled down while decoding, which is much faster than decoding
+    at full resolution (e.g. JPEGs can be decoded at reduced size).
     """
 
-    img = QtGui.QImage(path)
-    if img.isNull():
-        return img
+    if path is None:
+        return QtGui.QImage()
+
+    reader = QtGui.QImageReader(path)
+    if max_size:
+        size = reader.size()
+        if max(size.width(), size.height()) > max_size:
+            # Keep at least one pixel for very narrow images, which
+            # would otherwise scale to an empty size and fail to load
+            reader.setScaledSize(size.scaled(
+                max_size, max_size, QtCore.Qt.AspectRatioMode.KeepAspectRatio
+            ).expandedTo(QtCore.QSize(1, 1)))
+    reader.setAutoTransform(True)
+    return reader.read()
+
+
+def load_image(path, max_size=None):
+    """Loads an image from a file name or URL.
+
+    Returns a tuple of the image and the normalized file name or URL. If
+    ``max_size`` is given, larger images will be scaled down to fit.
+    """
 
-    with open(path, 'rb') as f:
-        try:
-            exifimg = exif.Image(f)
-        except (plum.exceptions.UnpackError, NotImplementedError):
-            logger.exception(f'Exif parser failed on image: {path}')
-            return img
-
-    try:
-        if 'orientation' in exifimg.list_all():
-            orientation = exifimg.orientation
-        else:
-            return img
-    except (NotImplementedError, ValueError):
-        logger.exception(f'Exif failed reading orientation of image: {path}')
-        return img
-
-    transform = QtGui.QTransform()
-
-    if orientation == exif.Orientation.TOP_RIGHT:
-        return img.mirrored(horizontal=True, vertical=False)
-    if orientation == exif.Orientation.BOTTOM_RIGHT:
-        transform.rotate(180)
-        return img.transformed(transform)
-    if orientation == exif.Orientation.BOTTOM_LEFT:
-        return img.mirrored(horizontal=False, vertical=True)
-    if orientation == exif.Orientation.LEFT_TOP:
-        transform.rotate(90)
-        return img.transformed(transform).mirrored(
-            horizontal=True, vertical=False)
-    if orientation == exif.Orientation.RIGHT_TOP:
-        transform.rotate(90)
-        return img.transformed(transform)
-    if orientation == exif.Orientation.RIGHT_BOTTOM:
-        transform.rotate(270)
-        return img.transformed(transform).mirrored(
-            horizontal=True, vertical=False)
-    if orientation == exif.Orientation.LEFT_BOTTOM:
-        transform.rotate(270)
-        return img.transformed(transform)
-
-    return img
-
-
-def load_image(path):
     if isinstance(path, str):
         path = os.path.normpath(path)
-        return (exif_rotated_image(path), path)
+        return (exif_rotated_image(path, max_size), path)
     if path.isLocalFile():
         path = os.path.normpath(path.toLocalFile())
-        return (exif_rotated_image(path), path)
+        return (exif_rotated_image(path, max_size), path)
 
     url = bytes(path.toEncoded()).decode()
     domain = '.'.join(parse.urlparse(url).netloc.split(".")[-2:])
@@ -99,15 +84,14 @@ def load_image(path):
             url = root.xpath("//img")[0].get('src')
         except Exception as e:
             logger.debug(f'Pinterest image download failed: {e}')
-    try:
-        imgdata = request.urlopen(url).read()
-    except URLError as e:
-        logger.debug(f'Downloading image failed: {e.reason}')
-    else:
-        with tempfile.TemporaryDirectory() as tmp:
-            fname = os.path.join(tmp, 'img')
-            with open(fname, 'wb') as f:
-                f.write(imgdata)
-                logger.debug(f'Temporarily saved in: {fname}')
-            img = exif_rotated_image(fname)
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = os.path.join(tmp, 'img')
+        try:
+            with request.urlopen(url) as response, open(fname, 'wb') as f:
+                shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+        except URLError as e:
+            logger.debug(f'Downloading image failed: {e.reason}')
+        else:
+            logger.debug(f'Temporarily saved in: {fname}')
+            img = exif_rotated_image(fname, max_size)
     return (img, url)
@@ -79,6 +79,15 @@ def imgfilename3x3():
     yield os.path.join(root, 'assets', 'test3x3.png')
 
 
+@pytest.fixture
+def jpgfilename40x20(tmpdir):
+    fname = os.path.join(tmpdir, 'test.jpg')
+    img = QtGui.QImage(40, 20, QtGui.QImage.Format.Format_RGB32)
+    img.fill(QtGui.QColor(255, 0, 0))
+    img.save(fname)
+    yield fname
+
+
 @pytest.fixture
 def imgdata3x3(imgfilename3x3):
     with open(imgfilename3x3, 'rb') as f:
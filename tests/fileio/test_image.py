@@ -1,12 +1,10 @@
 import math
 import os.path
-from unittest.mock import patch
+import shutil
 
 import httpretty
 import pytest
 
-import plum
-
 from PyQt6 import QtCore, QtGui
 
 from beeref.fileio.image import exif_rotated_image, load_image
@@ -22,18 +20,18 @@ def test_exif_rotated_image_not_a_file(qapp):
     assert img.isNull() is True
 
 
-def test_exif_rotated_image_exif_unpack_error(qapp, imgfilename3x3):
-    with patch('beeref.fileio.image.exif.Image',
-               side_effect=plum.exceptions.UnpackError()):
-        img = exif_rotated_image(imgfilename3x3)
-        assert img.isNull() is False
+def get_asset(name):
+    root = os.path.dirname(__file__)
+    return os.path.join(root, '..', 'assets', name)
 
 
-def test_exif_rotated_image_exif_notimplementederror(qapp, imgfilename3x3):
-    with patch('beeref.fileio.image.exif.Image.list_all',
-               side_effect=NotImplementedError()):
-        img = exif_rotated_image(imgfilename3x3)
-        assert img.isNull() is False
+def test_exif_rotated_image_without_extension(qapp, tmpdir):
+    path = get_asset('test3x3_orientation6.jpg')
+    fname = os.path.join(tmpdir, 'img')
+    shutil.copyfile(path, fname)
+    img = exif_rotated_image(fname)
+    assert img.isNull() is False
+    assert img == QtGui.QImage(path).transformed(QtGui.QTransform().rotate(90))
 
 
 @pytest.mark.parametrize('path,expected',
@@ -47,13 +45,9 @@ def test_exif_rotated_image_exif_notimplementederror(qapp, imgfilename3x3):
                           ('test3x3_orientation7.jpg', 'test3x3.jpg'),
                           ('test3x3_orientation8.jpg', 'test3x3.jpg')])
 def test_exif_rotated_image(path, expected, qapp):
-    def get_fname(p):
-        root = os.path.dirname(__file__)
-        return os.path.join(root, '..', 'assets', p)
-
-    img = exif_rotated_image(get_fname(path))
+    img = exif_rotated_image(get_asset(path))
     assert img.isNull() is False
-    expected = QtGui.QImage(get_fname(expected))
+    expected = QtGui.QImage(get_asset(expected))
     assert expected.isNull() is False
 
     # The JPEG format isn't pixel perfect, so we have to check whether
@@ -66,12 +60,53 @@ def test_exif_rotated_image(path, expected, qapp):
             assert math.sqrt(sum(diff)) < 3
 
 
+def test_exif_rotated_image_max_size(qapp, jpgfilename40x20):
+    img = exif_rotated_image(jpgfilename40x20, max_size=10)
+    assert img.size() == QtCore.QSize(10, 5)
+
+
+def test_exif_rotated_image_max_size_rotated(qapp, jpgfilename40x20):
+    # Copy the EXIF segment (right after the start of image marker)
+    # from a rotated test image into our image
+    with open(get_asset('test3x3_orientation6.jpg'), 'rb') as f:
+        data = f.read()
+    exif_segment = data[2:4 + int.from_bytes(data[4:6], 'big')]
+    with open(jpgfilename40x20, 'rb') as f:
+        data = f.read()
+    with open(jpgfilename40x20, 'wb') as f:
+        f.write(data[:2] + exif_segment + data[2:])
+
+    img = exif_rotated_image(jpgfilename40x20, max_size=10)
+    assert img.size() == QtCore.QSize(5, 10)
+
+
+def test_exif_rotated_image_max_size_smaller_image(qapp, jpgfilename40x20):
+    img = exif_rotated_image(jpgfilename40x20, max_size=50)
+    assert img.size() == QtCore.QSize(40, 20)
+
+
+def test_exif_rotated_image_max_size_very_wide_image(qapp, tmpdir):
+    fname = os.path.join(tmpdir, 'test.jpg')
+    img = QtGui.QImage(3000, 40, QtGui.QImage.Format.Format_RGB32)
+    img.fill(QtGui.QColor(255, 0, 0))
+    img.save(fname)
+    img = exif_rotated_image(fname, max_size=64)
+    assert img.isNull() is False
+    assert img.size() == QtCore.QSize(64, 1)
+
+
 def test_load_image_loads_from_filename(view, imgfilename3x3):
     img, filename = load_image(imgfilename3x3)
     assert img.isNull() is False
     assert filename == imgfilename3x3
 
 
+def test_load_image_loads_from_filename_with_max_size(view, imgfilename3x3):
+    img, filename = load_image(imgfilename3x3, max_size=2)
+    assert img.size() == QtCore.QSize(2, 2)
+    assert filename == imgfilename3x3
+
+
 def test_load_image_loads_from_nonexisting_filename(view, imgfilename3x3):
     img, filename = load_image('foo.png')
     assert img.isNull() is True
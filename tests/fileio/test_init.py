@@ -1,6 +1,7 @@
 import os.path
 import tempfile
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import MagicMock, call, patch
 
 from PyQt6 import QtCore
 
@@ -84,3 +85,35 @@ def test_load_images_error(view, imgfilename3x3):
     assert cmd.scene == view.scene
     assert cmd.ignore_first_redo is True
     assert item.pos() == QtCore.QPointF(3.5, 4.5)
+
+
+def test_load_images_keeps_order(view, imgfilename3x3):
+    root = os.path.dirname(__file__)
+    jpgfilename = os.path.normpath(
+        os.path.join(root, '..', 'assets', 'test3x3.jpg'))
+    filenames = [jpgfilename, 'foo.jpg', imgfilename3x3]
+    real_load_image = fileio.image.load_image
+    last_loaded = threading.Event()
+    finished = []
+
+    def load_image(filename):
+        if filename == filenames[0]:
+            # Make the first file finish last
+            assert last_loaded.wait(timeout=5)
+        result = real_load_image(filename)
+        finished.append(filename)
+        if filename == filenames[-1]:
+            last_loaded.set()
+        return result
+
+    view.scene.undo_stack = MagicMock()
+    worker = MagicMock(canceled=False)
+    with patch('beeref.fileio.load_image', side_effect=load_image):
+        fileio.load_images(filenames, QtCore.QPointF(5, 6), view.scene,
+                           worker)
+    assert finished.index(jpgfilename) > finished.index(imgfilename3x3)
+    assert worker.progress.emit.call_args_list == [call(0), call(1), call(2)]
+    worker.finished.emit.assert_called_once_with('', ['foo.jpg'])
+    itemdata = queue2list(view.scene.items_to_add)
+    assert [data[0]['item'].filename for data in itemdata] == [
+        jpgfilename, imgfilename3x3]
@@ -10,7 +10,9 @@
 
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import glob
+import hashlib
 import json
 import logging
 import os
@@ -35,6 +37,10 @@ parser.add_argument(
     default=False,
     action='store_true',
     help='Re-use downloaded files if present')
+parser.add_argument(
+    '--python-sha256',
+    help=('Expected SHA-256 digest of the python appimage; a present file '
+          'is only re-used if it matches'))
 parser.add_argument(
     '--skip-apt',
     default=False,
@@ -54,6 +60,7 @@ APPIMAGE = 'python3.11.9-cp311-cp311-manylinux2014_x86_64.AppImage'
 # ^ Siehe:
 # https://python-appimage.readthedocs.io/en/latest/#alternative-site-packages-location
 PYVER = '3.11'
+COPY_WORKERS = 8
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=getattr(logging, args.loglevel))
 
@@ -64,25 +71,77 @@ def run_command(*args, capture_output=False):
     assert result.returncode == 0, f'Failed with exit code {result.returncode}'
 
 
-def download_file(url, filename):
-    if not args.redownload and os.path.exists(filename):
+def sha256sum(filename):
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_reusable(filename, expected_sha256=None):
+    if args.redownload or not os.path.exists(filename):
+        return False
+    if expected_sha256 is None:
         logger.info(f'Found file: {filename}')
-    else:
+        return True
+    if sha256sum(filename) == expected_sha256:
+        logger.info(f'Found file with matching checksum: {filename}')
+        return True
+    logger.info(f'Found file with wrong checksum: {filename}')
+    return False
+
+
+def download_file(url, filename, expected_sha256=None):
+    if not is_reusable(filename, expected_sha256):
         logger.info(f'Downloading: {url}')
         logger.info(f'Saving as: {filename}')
         urlretrieve(url, filename=filename)
-    os.chmod(filename, 0o755)
-
-
+        if expected_sha256 is not None:
+            assert sha256sum(filename) == expected_sha256, \
+                f'Checksum mismatch for downloaded file {filename}'
+        os.chmod(filename, 0o755)
+
+
+def copy_lib(src, dest):
+    logger.debug(f'Copying {src} to {dest}')
+    # On Linux, copyfile copies in-kernel via sendfile, so there's no
+    # need to bounce the data through userspace buffers ourselves.
+    # We don't need the permissions or metadata of the source files.
+    shutil.copyfile(src, dest)
+
+
+def walk_names(path):
+    """Yields the names of all files below the given directory."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_names(entry.path)
+            elif not entry.is_dir():
+                # Like os.walk, don't list symlinks to directories as files
+                yield entry.name
+
+
+# Start both downloads right away, so that they can run while we're
+# busy with other things:
+downloads = ThreadPoolExecutor(max_workers=2)
 url = ('https://github.com/niess/python-appimage/releases/download/'
        f'python{PYVER}/{APPIMAGE}')
-download_file(url, filename='python.appimage')
+python_download = downloads.submit(
+    download_file, url, filename='python.appimage',
+    expected_sha256=args.python_sha256)
+url = ('https://github.com/AppImage/AppImageKit/releases/download/'
+       'continuous/appimagetool-x86_64.AppImage')
+appimagetool_download = downloads.submit(
+    download_file, url, filename='appimagetool.appimage')
+downloads.shutdown(wait=False)
 
 
 try:
     shutil.rmtree('squashfs-root')
 except FileNotFoundError:
     pass
+python_download.result()
 run_command('./python.appimage', '--appimage-extract',
             capture_output=True)
 
@@ -96,7 +155,7 @@ with open(args.jsonfile, 'r') as f:
     data = json.loads(f.read())
 libs = data['libs']
 packages = data['packages']
-excludes = data['excludes']
+excludes = set(data['excludes'])
 paths = set()
 
 if not args.skip_apt:
@@ -104,26 +163,31 @@ if not args.skip_apt:
 
 logger.info('Copying .so files to appimage...')
 
-existing_files = []
-for root, subdirs, files in os.walk('squashfs-root'):
-    existing_files.extend(files)
+copies = []
+existing_files = set(walk_names('squashfs-root'))
 
 for lib in libs:
-    if os.path.basename(lib) in existing_files:
+    libdir, libname = os.path.split(lib)
+    if libname in existing_files:
         logger.debug(f'Skipping {lib} (already in appimage)')
         continue
-    if os.path.basename(lib) in excludes:
+    if libname in excludes:
         logger.debug(f'Skipping {lib} (excluded)')
         continue
-    paths.add(os.path.dirname(lib))
+    paths.add(libdir)
     if os.path.exists(lib):
         filename = lib
     else:
         filename, _ = os.path.splitext(lib)
     dest = f'squashfs-root{filename}'
     os.makedirs(os.path.dirname(dest), exist_ok=True)
-    logger.debug(f'Copying {filename} to {dest}')
-    shutil.copyfile(filename, f'squashfs-root{filename}')
+    copies.append((filename, dest))
+
+# Copying is I/O bound, so we can speed it up with threads
+with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+    futures = [executor.submit(copy_lib, src, dest) for src, dest in copies]
+    for future in futures:
+        future.result()  # Raise errors from the copy threads
 
 
 logger.info('Writing run script...')
@@ -219,10 +283,7 @@ shutil.copyfile('./beeref/assets/logo.svg', 'squashfs-root/logo.svg')
 shutil.copyfile('./beeref/assets/logo.png', 'squashfs-root/.DirIcon')
 
 
-url = ('https://github.com/AppImage/AppImageKit/releases/download/'
-       'continuous/appimagetool-x86_64.AppImage')
-
-download_file(url, filename='appimagetool.appimage')
+appimagetool_download.result()
 run_command('./appimagetool.appimage',
             'squashfs-root',
             f'BeeRef-{BEEVERSION}.appimage')